@@ -1,3 +1,8 @@
+import os
+import json
+import shutil
+import tempfile
+import hashlib
 import pandas as pd
 import altair as alt
 from pathlib import Path
@@ -8,9 +13,85 @@ from src.model import Model
 ROOT = str(Path(__file__).parents[1])
 
 
+SCALE_FACTOR = 2.0
+# in-progress writes in .artifacts, which pruning must leave alone
+TMP_PREFIX = ".tmp-"
+
+
+def renderer_version() -> str:
+    """ Version of the PNG renderer Altair uses, so upgrades invalidate cached charts """
+    try:
+        import vl_convert
+
+        return "vl-convert " + vl_convert.__version__
+    except ImportError:
+        return "unknown"
+
+
+def chart_digest(chart: alt.Chart) -> str:
+    """ Hash the Vega-Lite spec, which inlines the chart's DataFrame content """
+    spec = json.dumps(chart.to_dict(), sort_keys=True, default=str)
+    content = "|".join(
+        [spec, str(SCALE_FACTOR), "altair " + alt.__version__, renderer_version()]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def save_charts(charts: dict) -> None:
+    """ Save a batch of charts keyed by title, rendering only charts whose
+    spec and data have not already been rendered under charts/
+    """
+    charts_path = Path(ROOT) / "charts"
+    artifacts_path = charts_path / ".artifacts"
+    artifacts_path.mkdir(parents=True, exist_ok=True)
+
+    digests = {title: chart_digest(chart) for title, chart in charts.items()}
+
+    # render each distinct missing artifact once, in a single pass
+    to_render = {}
+    for title, digest in digests.items():
+        if not (artifacts_path / (digest + ".png")).exists():
+            to_render[digest] = charts[title]
+    for digest, chart in to_render.items():
+        # render to a temp file so an interrupted render never looks cached
+        fd, tmp = tempfile.mkstemp(prefix=TMP_PREFIX, suffix=".png", dir=artifacts_path)
+        os.close(fd)
+        try:
+            chart.save(tmp, format="png", scale_factor=SCALE_FACTOR)
+            os.replace(tmp, artifacts_path / (digest + ".png"))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    for title, digest in digests.items():
+        shutil.copyfile(
+            artifacts_path / (digest + ".png"), charts_path / (title + ".png")
+        )
+
+    # the index maps every named chart to its artifact; prune anything unreferenced
+    index_path = artifacts_path / "index.json"
+    index = json.loads(index_path.read_text()) if index_path.exists() else {}
+    index.update(digests)
+    index = {
+        title: digest
+        for title, digest in index.items()
+        if (charts_path / (title + ".png")).exists()
+    }
+    fd, tmp = tempfile.mkstemp(prefix=TMP_PREFIX, suffix=".json", dir=artifacts_path)
+    with os.fdopen(fd, "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp, index_path)
+
+    referenced = {digest + ".png" for digest in index.values()}
+    for path in artifacts_path.iterdir():
+        if path.name.startswith(TMP_PREFIX):
+            continue
+        if path != index_path and path.name not in referenced:
+            path.unlink()
+
+
 def save_chart(chart: alt.Chart, title: str) -> None:
-    charts_path = ROOT + "/charts/"
-    chart.save(charts_path + title + ".png", format="png", scale_factor=2.0)
+    save_charts({title: chart})
 
 
 def gen_data() -> pd.DataFrame:
@@ -94,8 +175,9 @@ if __name__ == "__main__":
         "ROIC",
         "ROIC and Customer Growth with Efficiency Deterioration",
     )
-    save_chart(chart, "ROIC_and_growth - deteriorate")
+    charts = {"ROIC_and_growth - deteriorate": chart}
 
     # hm_df = gen_heatmap_data()
-    # heatmap = make_heatmap(hm_df)
-    # save_chart(heatmap, "Heatmap.png")
+    # charts["Heatmap"] = make_heatmap(hm_df)
+
+    save_charts(charts)
@@ -0,0 +1,185 @@
+"""Keep operational calibration up to date from streaming truck-day records"""
+from typing import Iterable
+from collections import deque
+from dataclasses import dataclass, replace
+
+from src.model import Model
+from src.operations import Operations, Productivity
+
+
+@dataclass
+class OperationalRecord:
+    """ One truck's work on one working day. Each truck-day must be sent as exactly
+    one record: every record counts as a truck-day, so splitting a truck's day
+    across records would overstate truck-days and understate lifts per truck
+    """
+
+    day: int
+    lifts: int
+    m3: float
+    tonnes: float
+    km: float
+
+
+@dataclass
+class Totals:
+    """ Sufficient statistics for the Operations ratios """
+
+    lifts: float = 0
+    m3: float = 0
+    tonnes: float = 0
+    truck_days: float = 0
+    km: float = 0
+    days: float = 0
+
+    def add(self, other: "Totals") -> None:
+        self.lifts += other.lifts
+        self.m3 += other.m3
+        self.tonnes += other.tonnes
+        self.truck_days += other.truck_days
+        self.km += other.km
+        self.days += other.days
+
+    def subtract(self, other: "Totals") -> None:
+        self.lifts -= other.lifts
+        self.m3 -= other.m3
+        self.tonnes -= other.tonnes
+        self.truck_days -= other.truck_days
+        self.km -= other.km
+        self.days -= other.days
+
+    def scale(self, factor: float) -> None:
+        self.lifts *= factor
+        self.m3 *= factor
+        self.tonnes *= factor
+        self.truck_days *= factor
+        self.km *= factor
+        self.days *= factor
+
+
+class OperationsTracker:
+    def __init__(
+        self,
+        window_days: int = None,
+        decay: float = None,
+        working_days_per_year: int = 330,
+    ) -> None:
+        """ window_days keeps only the most recent days; decay (0-1) down-weights
+        each day's totals by that factor for every day that has passed since
+        """
+        if window_days is not None and window_days < 1:
+            raise ValueError(f"window_days must be at least 1, got {window_days}")
+        if decay is not None and not 0 < decay <= 1:
+            raise ValueError(f"decay must be in (0, 1], got {decay}")
+        self.window_days = window_days
+        self.decay = decay
+        self.working_days_per_year = working_days_per_year
+        self.num_customers = None
+        self.totals = Totals()
+        self.last_day = None
+        # per-day totals still inside the window, oldest first
+        self.days = deque()
+        # without a window, the days seen so far, so late records for a day with
+        # no records yet still count it as a working day
+        self.seen_days = set()
+
+    def ingest(
+        self, records: Iterable[OperationalRecord], num_customers: int = None
+    ) -> None:
+        """ Fold a batch into the running totals in time proportional to the batch.
+        Records older than the latest day already seen are counted on their own day:
+        dropped if outside the window, and down-weighted by their age under decay
+        """
+        by_day = {}
+        for r in records:
+            totals = by_day.setdefault(r.day, Totals())
+            totals.add(Totals(r.lifts, r.m3, r.tonnes, 1, r.km, 0))
+
+        for day in sorted(by_day):
+            if self.last_day is not None and day < self.last_day:
+                self.add_late_day(day, by_day[day])
+            else:
+                self.add_day(day, by_day[day])
+
+        if num_customers is not None:
+            self.num_customers = num_customers
+
+    def add_late_day(self, day: int, totals: Totals) -> None:
+        age = self.last_day - day
+        if self.window_days is not None:
+            if age >= self.window_days:
+                return
+            # keep the raw totals on their own day, so they are evicted with it
+            bucket = next((t for d, t in self.days if d == day), None)
+            if bucket is None:
+                totals.days = 1
+                position = sum(1 for d, _ in self.days if d < day)
+                self.days.insert(position, (day, replace(totals)))
+            else:
+                bucket.add(totals)
+        elif day not in self.seen_days:
+            totals.days = 1
+            self.seen_days.add(day)
+
+        if self.decay is not None:
+            totals.scale(self.decay ** age)
+        self.totals.add(totals)
+
+    def add_day(self, day: int, totals: Totals) -> None:
+        if self.last_day is None or day > self.last_day:
+            if self.decay is not None and self.last_day is not None:
+                self.totals.scale(self.decay ** (day - self.last_day))
+            totals.days = 1
+            self.days.append((day, totals))
+            self.last_day = day
+        else:
+            self.days[-1][1].add(totals)
+        self.totals.add(totals)
+
+        if self.window_days is None:
+            # nothing will ever be evicted, so only keep the current day
+            self.days = deque([self.days[-1]])
+            self.seen_days.add(day)
+            return
+
+        while self.days[0][0] <= day - self.window_days:
+            old_day, old = self.days.popleft()
+            if self.decay is not None:
+                # the running totals hold this day at its decayed weight
+                old.scale(self.decay ** (day - old_day))
+            self.totals.subtract(old)
+
+    def calibration(self, operations: Operations) -> Productivity:
+        """ Annualised Productivity equivalent to the tracked totals """
+        t = self.totals
+        if t.days == 0:
+            raise ValueError("no operational records have been ingested yet")
+        annualise = self.working_days_per_year / t.days
+        return Productivity(
+            avg_num_trucks=t.truck_days / t.days,
+            total_lifts=t.lifts * annualise,
+            total_m3_collected=t.m3 * annualise,
+            avg_km_per_truck_per_year=t.km / t.truck_days * self.working_days_per_year,
+            total_tonnes_disposed=t.tonnes * annualise,
+            working_days_per_year=self.working_days_per_year,
+            num_customers=self.num_customers
+            if self.num_customers is not None
+            else operations.calibration.num_customers,
+        )
+
+    def refresh(self, operations: Operations) -> None:
+        """ Recalibrate the operating ratios, leaving the fiscal-year productivity
+        used to back cost pools out of the financials untouched
+        """
+        operations.calibration = self.calibration(operations)
+
+    def apply(self, model: Model) -> None:
+        """ Refresh the model's Operations and the inputs calibrated from them.
+        revenue_per_m3 is left alone: it prices the fiscal year's revenue over that
+        year's volume, and streamed volume doesn't match that year's revenue
+        """
+        self.refresh(model.operations)
+        model.inputs.lifts_per_truck_day = model.operations.lifts_per_truck_day()
+        model.inputs.avg_tonnes_per_m3 = model.operations.avg_tonnes_per_m3()
+        if self.num_customers is not None:
+            model.inputs.num_customers = self.num_customers
@@ -6,7 +6,12 @@ from functools import partial
 from scipy.optimize import minimize
 
 from src.model import Model
-from src.analysis import save_chart
+from src.analysis import save_charts
+from src.sweep import Sweep
+
+HORIZON = 5
+GROWTH_RATES = [0.05, 0.1, 0.15]
+PROBABILITIES = [1 / 3, 1 / 3, 1 / 3]
 
 
 def base_demand() -> float:
@@ -71,48 +76,44 @@ def growth_forecast(base, horizon, growth_rate):
     return [base * (1 + growth_rate) ** y for y in range(1, horizon + 1)]
 
 
-growth_five_year = partial(growth_forecast, base_demand(), 5)
-
+growth_five_year = partial(growth_forecast, base_demand(), HORIZON)
 
-def calc_profits(new_trucks: int, growth_rate: float, discount_rate: float) -> float:
-    demand = growth_five_year(growth_rate)
-    profits = [calc_operating_income(new_trucks, di) for di in demand]
-    discounted_profits = [
-        p / ((1 + discount_rate) ** (i + 1)) for i, p in enumerate(profits)
-    ]
-    return sum(discounted_profits)
 
+def make_data() -> pd.DataFrame:
+    """ Probability-weighted discounted operating income less truck cost, for every
+    truck count and discount rate. Each piece is only evaluated on the dimensions
+    it depends on
+    """
+    sweep = Sweep(
+        discount_rate=[0, 0.05, 0.1, 0.15, 0.2],
+        new_trucks=range(0, 158 - 78, 2),
+        growth_rate=GROWTH_RATES,
+        year=range(1, HORIZON + 1),
+    )
+    probability = dict(zip(GROWTH_RATES, PROBABILITIES))
 
-def expected_profits(new_trucks: int, discount_rate: float) -> float:
-    cost = calc_cost(new_trucks)
-    growth_rates = [0.05, 0.1, 0.15]
-    probabilities = [1 / 3, 1 / 3, 1 / 3]
-    all_profits = [calc_profits(new_trucks, g, discount_rate) for g in growth_rates]
-    pweighted = [p * profit for p, profit in zip(probabilities, all_profits)]
-    return sum(pweighted) - cost
-
+    # demand on (growth x year), income on (trucks x growth x year),
+    # discounting on (discount rate x year), cost on trucks
+    sweep.add(
+        "num_customers",
+        lambda growth_rate, year: growth_five_year(growth_rate)[year - 1],
+    )
+    sweep.add("income", calc_operating_income)
+    sweep.add("discount", lambda discount_rate, year: (1 + discount_rate) ** -year)
+    sweep.add("probability", lambda growth_rate: probability[growth_rate])
+    sweep.add("cost", calc_cost)
 
-def make_data() -> pd.DataFrame:
-    num_trucks = range(0, 158 - 78, 2)
-    num_trucks_long = []
-    discount_rates = [0, 0.05, 0.1, 0.15, 0.2]
-    discount_rates_long = []
-    profits = []
-    for dr in discount_rates:
-        for nt in num_trucks:
-            p = expected_profits(nt, dr)
-            profits.append(p)
-            discount_rates_long.append(dr)
-            num_trucks_long.append(nt)
-
-    df = pd.DataFrame(
-        {
-            "num_trucks": num_trucks_long,
-            "discount_rate": discount_rates_long,
-            "expected_profit": profits,
-        }
+    pweighted = sweep.combine(
+        lambda income, discount, probability: income * discount * probability
     )
-    return df
+    expected_profit = pweighted.sum(
+        axis=(sweep.axis("growth_rate"), sweep.axis("year")), keepdims=True
+    ) - sweep.expand("cost")
+
+    df = sweep.to_frame(
+        expected_profit, "expected_profit", reduced=("growth_rate", "year")
+    ).rename(columns={"new_trucks": "num_trucks"})
+    return df[["num_trucks", "discount_rate", "expected_profit"]]
 
 
 def make_chart(df) -> alt.Chart:
@@ -130,5 +131,4 @@ def make_chart(df) -> alt.Chart:
 
 if __name__ == "__main__":
     df = make_data()
-    chart = make_chart(df)
-    save_chart(chart, "capacity_chart.png")
+    save_charts({"capacity_chart": make_chart(df)})
@@ -17,6 +17,10 @@ class Inputs:
     revenue_per_m3: float = None
     num_customers: float = None
     trucks_total: int = None
+    # share of demand served, set from the daily simulation, and the fleet,
+    # demand and per-truck productivity it was simulated for
+    service_level: float = None
+    service_level_basis: tuple = None
 
     # assumptions
     allocation_to_collection_unit: float = 0.75
@@ -139,12 +143,28 @@ class Model:
     def depot_overhead_cost(self, num_trucks: int) -> float:
         return self.inputs.depot_overhead_pct * self.depot_labor_cost(num_trucks)
 
-    def maintenance_cost(self, num_trucks: int) -> float:
-        return self.operations.truck.maintenance_per_truck_per_year * num_trucks
+    def maintenance_cost(
+        self, num_trucks: int, km_per_truck_per_year: float = None
+    ) -> float:
+        """ Defaults to the km per truck the operating ratios are calibrated on """
+        if km_per_truck_per_year is None:
+            km_per_truck_per_year = (
+                self.operations.calibration.avg_km_per_truck_per_year
+            )
+        return (
+            self.operations.maintenance_cost_per_km()
+            * km_per_truck_per_year
+            * num_trucks
+        )
 
-    def fuel_cost(self, num_trucks: int) -> float:
+    def fuel_cost(self, num_trucks: int, km_per_truck_per_year: float = None) -> float:
+        """ Defaults to the km per truck the operating ratios are calibrated on """
+        if km_per_truck_per_year is None:
+            km_per_truck_per_year = (
+                self.operations.calibration.avg_km_per_truck_per_year
+            )
         return (
-            self.operations.productivity.avg_km_per_truck_per_year
+            km_per_truck_per_year
             / self.operations.truck.fuel_econ_km_l
             * self.operations.truck.fuel_cost_per_l
             * num_trucks
@@ -157,8 +177,14 @@ class Model:
         return (
             self.income_statement.opex.other_opex
             - self.depot_overhead_cost(self.operations.productivity.avg_num_trucks)
-            - self.maintenance_cost(self.operations.productivity.avg_num_trucks)
-            - self.fuel_cost(self.operations.productivity.avg_num_trucks)
+            - self.maintenance_cost(
+                self.operations.productivity.avg_num_trucks,
+                self.operations.productivity.avg_km_per_truck_per_year,
+            )
+            - self.fuel_cost(
+                self.operations.productivity.avg_num_trucks,
+                self.operations.productivity.avg_km_per_truck_per_year,
+            )
         )
 
     def new_other_operating_cost(self) -> float:
@@ -235,7 +261,24 @@ class Model:
         """Baseline ROIC"""
         return self.income_statement.nopat() / self.balance_sheet.invested_capital()
 
+    def service_level_basis(self) -> tuple:
+        return (
+            self.inputs.trucks_total,
+            self.total_demand(),
+            self.inputs.lifts_per_truck_day,
+            self.operations.avg_vol_per_lift(),
+            self.operations.productivity.working_days_per_year,
+        )
+
     def demand_served(self) -> float:
+        """ Use the simulated service level only while the fleet and demand still
+        match what it was simulated for, otherwise cap demand at annual capacity
+        """
+        if (
+            self.inputs.service_level is not None
+            and self.inputs.service_level_basis == self.service_level_basis()
+        ):
+            return self.total_demand() * self.inputs.service_level
         fleet_capacity_accessible = (
             self.inputs.trucks_total
             * self.inputs.lifts_per_truck_day
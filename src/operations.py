@@ -4,50 +4,54 @@ from dataclasses import dataclass
 
 class Operations:
     def __init__(self) -> None:
+        # fiscal-year data, which the model uses to back cost pools out of the financials
         self.productivity = Productivity()
+        # data the operating ratios are calibrated on; starts as the fiscal year
+        # and can be replaced with more recent operational data
+        self.calibration = self.productivity
         self.truck = Truck()
         self.labor = Labor()
 
     def lifts_per_truck_day(self) -> float:
         return (
-            self.productivity.total_lifts
-            / self.productivity.working_days_per_year
-            / self.productivity.avg_num_trucks
+            self.calibration.total_lifts
+            / self.calibration.working_days_per_year
+            / self.calibration.avg_num_trucks
         )
 
     def m3_per_customer(self) -> float:
-        return self.productivity.total_m3_collected / self.productivity.num_customers
+        return self.calibration.total_m3_collected / self.calibration.num_customers
 
     def avg_vol_per_lift(self) -> float:
-        return self.productivity.total_m3_collected / self.productivity.total_lifts
+        return self.calibration.total_m3_collected / self.calibration.total_lifts
 
     def avg_tonnes_per_m3(self) -> float:
         return (
-            self.productivity.total_tonnes_disposed
-            / self.productivity.total_m3_collected
+            self.calibration.total_tonnes_disposed / self.calibration.total_m3_collected
         )
 
     def driver_cost_per_truck_day(self) -> float:
         return self.labor.driver_hourly_wage * self.labor.hours_per_shift
 
-    def fuel_cost_per_truck_day(self) -> float:
-        km_daily = (
-            self.productivity.avg_km_per_truck_per_year
-            / self.productivity.working_days_per_year
+    def km_per_truck_day(self) -> float:
+        return (
+            self.calibration.avg_km_per_truck_per_year
+            / self.calibration.working_days_per_year
         )
-        liters_daily = km_daily / self.truck.fuel_econ_km_l
+
+    def fuel_cost_per_truck_day(self) -> float:
+        liters_daily = self.km_per_truck_day() / self.truck.fuel_econ_km_l
         return liters_daily * self.truck.fuel_cost_per_l
 
-    def maintenance_cost_per_truck_day(self) -> float:
-        cost_per_km = (
+    def maintenance_cost_per_km(self) -> float:
+        """ Maintenance is a fiscal-year cost, so price it over that year's km """
+        return (
             self.truck.maintenance_per_truck_per_year
             / self.productivity.avg_km_per_truck_per_year
         )
-        km_daily = (
-            self.productivity.avg_km_per_truck_per_year
-            / self.productivity.working_days_per_year
-        )
-        return cost_per_km * km_daily
+
+    def maintenance_cost_per_truck_day(self) -> float:
+        return self.maintenance_cost_per_km() * self.km_per_truck_day()
 
 
 @dataclass
@@ -0,0 +1,139 @@
+"""Daily-resolution stochastic simulation of demand served"""
+import numpy as np
+from typing import Iterator
+from dataclasses import dataclass
+
+from src.model import Model
+
+
+@dataclass
+class SimulationInputs:
+    """ Assumptions on day-to-day variability and simulation size """
+
+    num_replications: int = 1000
+    # replications held in memory at once; bounds peak memory at
+    # chunk_size x working days x trucks floats
+    chunk_size: int = 50
+    demand_cv: float = 0.15
+    lifts_cv: float = 0.1
+    seed: int = None
+
+
+@dataclass
+class SimulationResult:
+    """ Per-replication annual totals, in m3 """
+
+    demand: np.ndarray
+    served: np.ndarray
+    overflow: np.ndarray
+    capacity: np.ndarray
+
+    def service_level(self) -> float:
+        return self.served.sum() / self.demand.sum()
+
+    def utilisation(self) -> np.ndarray:
+        return self.served / self.capacity
+
+    def mean_overflow(self) -> float:
+        return self.overflow.mean()
+
+
+def gamma_draws(
+    rng: np.random.Generator, mean: float, cv: float, size: tuple
+) -> np.ndarray:
+    """ Draw non-negative values with the given mean and coefficient of variation """
+    if cv <= 0:
+        return np.full(size, mean, dtype=float)
+    shape = 1 / cv ** 2
+    return rng.gamma(shape, mean / shape, size=size)
+
+
+class Simulation:
+    """ Simulates the model's current fleet, so model.inputs.trucks_total must be set
+    (e.g. with model.set_trucks()) before running
+    """
+
+    def __init__(self, model: Model, inputs: SimulationInputs = None) -> None:
+        self.model = model
+        self.inputs = inputs if inputs is not None else SimulationInputs()
+        if self.inputs.num_replications < 1:
+            raise ValueError(
+                f"num_replications must be at least 1, got {self.inputs.num_replications}"
+            )
+        if self.inputs.chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be at least 1, got {self.inputs.chunk_size}"
+            )
+
+    def daily_demand(self) -> float:
+        return (
+            self.model.total_demand()
+            / self.model.operations.productivity.working_days_per_year
+        )
+
+    def chunk_sizes(self) -> Iterator[int]:
+        remaining = self.inputs.num_replications
+        while remaining > 0:
+            size = min(self.inputs.chunk_size, remaining)
+            yield size
+            remaining -= size
+
+    def simulate_chunks(self) -> Iterator[SimulationResult]:
+        """ Simulate replications a chunk at a time so memory stays bounded
+        regardless of the number of replications
+        """
+        if self.model.inputs.trucks_total is None:
+            raise ValueError(
+                "trucks_total is not set; call model.set_trucks() or set it before simulating"
+            )
+        rng = np.random.default_rng(self.inputs.seed)
+        days = self.model.operations.productivity.working_days_per_year
+        trucks = int(self.model.inputs.trucks_total)
+        vol_per_lift = self.model.operations.avg_vol_per_lift()
+
+        for size in self.chunk_sizes():
+            demand = gamma_draws(
+                rng, self.daily_demand(), self.inputs.demand_cv, (size, days)
+            )
+            lifts = gamma_draws(
+                rng,
+                self.model.inputs.lifts_per_truck_day,
+                self.inputs.lifts_cv,
+                (size, days, trucks),
+            )
+            capacity = lifts.sum(axis=2) * vol_per_lift
+            served = np.minimum(demand, capacity)
+            yield SimulationResult(
+                demand=demand.sum(axis=1),
+                served=served.sum(axis=1),
+                overflow=(demand - served).sum(axis=1),
+                capacity=capacity.sum(axis=1),
+            )
+
+    def run(self) -> SimulationResult:
+        """ Run all replications, keeping only annual totals per replication """
+        chunks = list(self.simulate_chunks())
+        return SimulationResult(
+            demand=np.concatenate([c.demand for c in chunks]),
+            served=np.concatenate([c.served for c in chunks]),
+            overflow=np.concatenate([c.overflow for c in chunks]),
+            capacity=np.concatenate([c.capacity for c in chunks]),
+        )
+
+    def apply(self) -> SimulationResult:
+        """ Run the simulation and feed the realised service level back into the model,
+        so revenue and disposal cost reflect demand lost on peak days. The level only
+        applies while the model's fleet and demand are unchanged
+        """
+        result = self.run()
+        self.model.inputs.service_level = result.service_level()
+        self.model.inputs.service_level_basis = self.model.service_level_basis()
+        return result
+
+
+def simulate_scenarios(
+    models: list, inputs: SimulationInputs = None
+) -> Iterator[SimulationResult]:
+    """ Simulate each scenario in turn, so only one scenario's chunk is in memory at a time """
+    for model in models:
+        yield Simulation(model, inputs).run()
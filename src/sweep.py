@@ -0,0 +1,84 @@
+"""Evaluate multi-dimensional sweeps one sub-expression at a time on its own axes"""
+import numpy as np
+import pandas as pd
+from inspect import signature
+from typing import Callable, Tuple
+from dataclasses import dataclass
+
+
+@dataclass
+class Term:
+    dims: Tuple[str, ...]
+    values: np.ndarray
+
+
+class Sweep:
+    def __init__(self, **dims) -> None:
+        # order of the keyword arguments sets the axis order of combined results
+        self.dims = {name: list(values) for name, values in dims.items()}
+        self.terms = {}
+
+    def axis(self, dim: str) -> int:
+        return list(self.dims).index(dim)
+
+    def term_dims(self, params: list) -> Tuple[str, ...]:
+        """ The minimal axes a function of these parameters varies along """
+        used = set()
+        for p in params:
+            if p in self.dims:
+                used.add(p)
+            elif p in self.terms:
+                used.update(self.terms[p].dims)
+            else:
+                raise KeyError(f"{p} is neither a sweep dimension nor a term")
+        return tuple(d for d in self.dims if d in used)
+
+    def value(self, param: str, point: dict):
+        if param in self.dims:
+            return self.dims[param][point[param]]
+        term = self.terms[param]
+        return term.values[tuple(point[d] for d in term.dims)]
+
+    def add(self, name: str, func: Callable) -> np.ndarray:
+        """ Evaluate func once per point on its minimal axes; its parameters are
+        matched by name to sweep dimensions or previously added terms
+        """
+        if name in self.dims:
+            raise ValueError(f"{name} is already a sweep dimension")
+        if name in self.terms:
+            raise ValueError(f"{name} is already a term")
+        params = list(signature(func).parameters)
+        dims = self.term_dims(params)
+        shape = tuple(len(self.dims[d]) for d in dims)
+        values = np.empty(shape)
+        for idx in np.ndindex(*shape):
+            point = dict(zip(dims, idx))
+            values[idx] = func(*[self.value(p, point) for p in params])
+        self.terms[name] = Term(dims, values)
+        return values
+
+    def expand(self, param: str) -> np.ndarray:
+        """ View a dimension or term with size-1 axes for every dimension it doesn't vary along """
+        if param in self.dims:
+            dims, values = (param,), np.array(self.dims[param])
+        else:
+            dims, values = self.terms[param].dims, self.terms[param].values
+        shape = [len(self.dims[d]) if d in dims else 1 for d in self.dims]
+        return values.reshape(shape)
+
+    def combine(self, func: Callable) -> np.ndarray:
+        """ Broadcast-combine dimensions and terms, matched by parameter name """
+        params = list(signature(func).parameters)
+        return func(*[self.expand(p) for p in params])
+
+    def to_frame(
+        self, values: np.ndarray, name: str, reduced: Tuple[str, ...] = ()
+    ) -> pd.DataFrame:
+        """ Long-format frame of a result over every dimension not in reduced,
+        which were summed out with keepdims
+        """
+        dims = [d for d in self.dims if d not in reduced]
+        shape = [1 if d in reduced else len(self.dims[d]) for d in self.dims]
+        values = np.broadcast_to(values, shape)
+        index = pd.MultiIndex.from_product([self.dims[d] for d in dims], names=dims)
+        return pd.DataFrame({name: values.ravel()}, index=index).reset_index()